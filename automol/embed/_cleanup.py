@@ -373,8 +373,8 @@ def gradient_convergence_checker_(thresh=1e-1):
     def _is_converged(xmat, err, grad):
         assert numpy.shape(xmat) == numpy.shape(grad)
         grad_max = numpy.amax(numpy.abs(grad))
-        logging.info('\tError: {:f}'.format(err))
-        logging.info('\tMax gradient: {:f}'.format(grad_max))
+        logging.info('\tError: %f', err)
+        logging.info('\tMax gradient: %f', grad_max)
         logging.info('\n')
         return grad_max < thresh
 
@@ -396,12 +396,14 @@ def minimize_error(xmat, err_, grad_, conv_, maxiter=None):
 
     sd0 = None
     cd0 = None
-    logging.info('Initial error: {:f}'.format(err_(xmat)))
+    # (only evaluate the error for the log if it is going to be written)
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info('Initial error: %f', err_(xmat))
 
     converged = False
 
     for niter in range(maxiter):
-        logging.info('Iteration {:d}'.format(niter))
+        logging.info('Iteration %d', niter)
 
         # 1. Calculate the steepest direction
         sd1 = -grad_(xmat)
@@ -430,8 +432,8 @@ def minimize_error(xmat, err_, grad_, conv_, maxiter=None):
         sd0 = sd1
         cd0 = cd1
 
-    logging.info('Niter: {:d}'.format(niter))
-    logging.info('Converged: {:s}'.format('Yes' if converged else 'No'))
+    logging.info('Niter: %d', niter)
+    logging.info('Converged: %s', 'Yes' if converged else 'No')
     logging.info('\n')
 
     return xmat, converged
@@ -16,10 +16,11 @@ def troe_lj_collision_frequency(eps, sig, red_mass, temp):
         :type sig: float
         :param red_mass: Reduced mass of colliding bodies (in kg)
         :type red_mass: float
-        :param temp: Temperature at which the collision occurs
-        :type temp: float
-        :return zlj: Lennard-Jones collision frequency (in _)
-        :rtype: float
+        :param temp: Temperature(s) at which the collision occurs
+        :type temp: float or numpy.ndarray
+        :return zlj: Lennard-Jones collision frequency (in _), with the same
+            shape as `temp`
+        :rtype: float or numpy.ndarray
     """
 
     pref1 = 1.0e-14 * numpy.sqrt(
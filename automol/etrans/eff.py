@@ -37,10 +37,11 @@ def alpha(n_eff, eps, sig, mass1, mass2, bath_model, tgt_model):
 
     # Calculate alpha = Zalpha(Neff) / Z(N) at T = 300, 1000, 2000 K
     # Empirical correction factor of (1/2) used for 1D Master Equations
-    alpha_dct = {}
-    for temp, z_alpha_n_eff in z_alphas_n_eff.items():
-        zlj = troe_lj_collision_frequency(eps, sig, red_mass, temp)
-        alpha_dct[temp] = (z_alpha_n_eff / zlj) / 2.0
+    # (the collision frequencies are evaluated over all temperatures at once)
+    temps, z_alphas = zip(*z_alphas_n_eff.items())
+    zljs = troe_lj_collision_frequency(
+        eps, sig, red_mass, numpy.array(temps, dtype=numpy.float64))
+    alpha_dct = dict(zip(temps, (numpy.array(z_alphas) / zljs) / 2.0))
 
     # Determine alpha and n for the e-down model
     edown_alpha, edown_n = _calculate_energy_down_exponent(alpha_dct)
@@ -173,11 +173,13 @@ def to_conformers(rdm, nconfs):
         geos.append(
             automol.geom.base.from_data(syms, xyzs, angstrom=True))
     else:
-        cids = _rd_all_chem.EmbedMultipleConfs(rdm, numConfs=nconfs)
-        res = _rd_all_chem.MMFFOptimizeMoleculeConfs(rdm)
+        # numThreads=0 spreads the conformers over all available cores
+        cids = _rd_all_chem.EmbedMultipleConfs(rdm, numConfs=nconfs,
+                                               numThreads=0)
+        res = _rd_all_chem.MMFFOptimizeMoleculeConfs(rdm, numThreads=0)
         energies = list(zip(*res))[1]
+        syms = tuple(str(rda.GetSymbol()).title() for rda in atms)
         for cid in cids:
-            syms = tuple(str(rda.GetSymbol()).title() for rda in atms)
             xyzs = tuple(map(tuple, rdm.GetConformer(cid).GetPositions()))
             geos.append(
                 automol.geom.base.from_data(syms, xyzs, angstrom=True))
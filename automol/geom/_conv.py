@@ -3,6 +3,7 @@
 
 import itertools
 import numpy
+from scipy.spatial import cKDTree
 import automol.graph
 import automol.zmat.base
 import automol.inchi.base
@@ -52,25 +53,32 @@ def connectivity_graph(geo,
     """
 
     symbs = symbols(geo)
-    xyzs = coordinates(geo)
-
-    def _distance(idx_pair):
-        xyz1, xyz2 = map(xyzs.__getitem__, idx_pair)
-        dist = numpy.linalg.norm(numpy.subtract(xyz1, xyz2))
-        return dist
-
-    def _are_bonded(idx_pair):
-        sym1, sym2 = map(symbs.__getitem__, idx_pair)
-        dist = _distance(idx_pair)
-        return (False if 'X' in (sym1, sym2) else
-                (dist < rqh_bond_max) if 'H' in (sym1, sym2) else
-                (dist < rhh_bond_max) if (sym1 == 'H' and sym2 == 'H') else
-                (dist < rqq_bond_max))
-
-    idxs = range(len(xyzs))
+    xyzs = numpy.reshape(coordinates(geo), (-1, 3))
+
+    # candidate pairs within the largest cutoff, from a k-d tree search
+    max_cut = max(rqq_bond_max, rqh_bond_max, rhh_bond_max)
+    idx_pairs = cKDTree(xyzs).query_pairs(r=max_cut, output_type='ndarray')
+    idx_pairs = numpy.reshape(idx_pairs, (-1, 2))
+    idx_pairs = idx_pairs[numpy.lexsort((idx_pairs[:, 1], idx_pairs[:, 0]))]
+    dists = numpy.linalg.norm(
+        xyzs[idx_pairs[:, 0]] - xyzs[idx_pairs[:, 1]], axis=1)
+
+    # the bond cutoff for each pair; the conditions are checked in order, so
+    # dummy atoms are never bonded and any pair involving a hydrogen takes the
+    # heavy atom-hydrogen cutoff
+    symb_arr = numpy.array(symbs, dtype=str)
+    is_x = (symb_arr == 'X')[idx_pairs]
+    is_h = (symb_arr == 'H')[idx_pairs]
+    max_dists = numpy.select(
+        [numpy.any(is_x, axis=1),
+         numpy.any(is_h, axis=1),
+         numpy.all(is_h, axis=1)],
+        [0., rqh_bond_max, rhh_bond_max], default=rqq_bond_max)
+
+    idx_pairs = idx_pairs[dists < max_dists]
+
     atm_symb_dct = dict(enumerate(symbs))
-    bnd_keys = tuple(
-        map(frozenset, filter(_are_bonded, itertools.combinations(idxs, r=2))))
+    bnd_keys = tuple(frozenset(map(int, idx_pair)) for idx_pair in idx_pairs)
 
     bnd_ord_dct = {bnd_key: 1 for bnd_key in bnd_keys}
 
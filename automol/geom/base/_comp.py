@@ -4,12 +4,13 @@
 
 import functools
 import numpy
+from scipy.spatial.distance import cdist
 from phydat import ptab
 from automol.geom.base._core import symbols
+from automol.geom.base._core import count
 from automol.geom.base._core import coordinates
 from automol.geom.base._core import xyz_string
 from automol.geom.base._core import from_string
-from automol.geom.base._core import distance
 
 
 # # properties used for comparisons
@@ -68,10 +69,8 @@ def distance_matrix(geo):
         :rtype: numpy.ndarray
     """
 
-    mat = numpy.zeros((len(geo), len(geo)))
-    for i in range(len(geo)):
-        for j in range(len(geo)):
-            mat[i][j] = distance(geo, i, j)
+    xyzs = numpy.reshape(coordinates(geo), (-1, 3))
+    mat = cdist(xyzs, xyzs)
 
     return mat
 
@@ -158,15 +157,13 @@ def almost_equal_dist_matrix(geo1, geo2, thresh=0.1):
     """form distance matrix for a set of xyz coordinates
     """
 
-    natoms = len(geo1)
-    for i in range(natoms):
-        for j in range(natoms):
-            dist_mat1_ij = distance(geo1, i, j)
-            dist_mat2_ij = distance(geo2, i, j)
-            if abs(dist_mat1_ij - dist_mat2_ij) > thresh:
-                return False
+    if count(geo1) != count(geo2):
+        return False
 
-    return True
+    dist_mat1 = distance_matrix(geo1)
+    dist_mat2 = distance_matrix(geo2)
+
+    return bool(numpy.all(numpy.abs(dist_mat1 - dist_mat2) <= thresh))
 
 
 def minimum_volume_geometry(geos):
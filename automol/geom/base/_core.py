@@ -99,13 +99,17 @@ def coordinates(geo, idxs=None, angstrom=False):
         :rtype: tuple(tuple(float))
     """
 
-    idxs = list(range(count(geo))) if idxs is None else idxs
     if geo:
         _, xyzs = zip(*geo)
     else:
         xyzs = ()
     xyzs = xyzs if not angstrom else numpy.multiply(xyzs, phycon.BOHR2ANG)
-    xyzs = tuple(tuple(xyz) for idx, xyz in enumerate(xyzs) if idx in idxs)
+    if idxs is None:
+        xyzs = tuple(map(tuple, xyzs))
+    else:
+        idxs = set(idxs)
+        xyzs = tuple(tuple(xyz) for idx, xyz in enumerate(xyzs)
+                     if idx in idxs)
 
     return xyzs
 
@@ -128,8 +132,10 @@ def set_coordinates(geo, xyz_dct):
     natms = len(symbs)
     assert all(idx in range(natms) for idx in xyz_dct)
 
-    xyzs = [xyz_dct[idx] if idx in xyz_dct else xyz
-            for idx, xyz in enumerate(xyzs)]
+    # only overwrite the coordinates that change
+    xyzs = list(xyzs)
+    for idx, xyz in xyz_dct.items():
+        xyzs[idx] = xyz
 
     return from_data(symbs, xyzs)
 
@@ -992,7 +998,7 @@ def transform(geo, func, idxs=None):
         :type idxs: tuple(int)
     """
 
-    idxs = list(range(count(geo))) if idxs is None else idxs
+    idxs = range(count(geo)) if idxs is None else set(idxs)
     symbs = symbols(geo)
     xyzs = coordinates(geo)
     xyzs = [func(xyz) if idx in idxs else xyz for idx, xyz in enumerate(xyzs)]
@@ -123,6 +123,8 @@ from automol.graph.base._algo import full_subgraph_isomorphism
 from automol.graph.base._algo import backbone_isomorphism
 from automol.graph.base._algo import backbone_isomorphic
 from automol.graph.base._algo import backbone_unique
+from automol.graph.base._algo import full_unique_indices
+from automol.graph.base._algo import isomorphism_invariant
 from automol.graph.base._algo import equivalent_atoms
 from automol.graph.base._algo import equivalent_bonds
 from automol.graph.base._algo import are_equivalent_atoms
@@ -365,6 +367,8 @@ __all__ = [
     'backbone_isomorphism',
     'backbone_isomorphic',
     'backbone_unique',
+    'full_unique_indices',
+    'isomorphism_invariant',
     'equivalent_atoms',
     'equivalent_bonds',
     'are_equivalent_atoms',
@@ -12,6 +12,8 @@ from automol import util
 from automol.util import dict_
 from automol.graph.base import _networkx
 from automol.graph.base import _igraph
+from automol.graph.base._core import atoms
+from automol.graph.base._core import bonds
 from automol.graph.base._core import atom_keys
 from automol.graph.base._core import bond_keys
 from automol.graph.base._core import atom_symbols
@@ -142,19 +144,84 @@ def backbone_isomorphic(gra1, gra2):
 def backbone_unique(gras):
     """ unique non-isomorphic graphs from a series
     """
-    gras = _unique(gras, equiv=backbone_isomorphic)
+    gras = tuple(gras)
+    igras = tuple(map(implicit, gras))
+    idxs = _unique_indices(igras, equiv=_networkx_isomorphic,
+                           conv=_networkx.from_graph,
+                           inv=isomorphism_invariant)
+    gras = tuple(gras[idx] for idx in idxs)
     return gras
 
 
-def _unique(itms, equiv):
-    """ unique items from a list, according to binary comparison `equiv`
+def full_unique_indices(gras):
+    """ indices of the fully non-isomorphic graphs in a series
+
+    (the first of each set of isomorphic graphs is kept; each graph is
+    converted for comparison once, rather than once per pair, and only pairs
+    with matching invariants are checked for isomorphism)
+
+    :param gras: the graphs
+    :returns: the indices of the unique graphs, in order
+    :rtype: tuple[int]
+    """
+    assert all(gra == explicit(gra) for gra in gras)
+    return _unique_indices(gras, equiv=_networkx_isomorphic,
+                           conv=_networkx.from_graph,
+                           inv=isomorphism_invariant)
+
+
+def isomorphism_invariant(gra, niter=3):
+    """ a cheap invariant for ruling out isomorphisms
+
+    Atom labels start from the atom values and are refined `niter` times
+    with the sorted (bond value, neighbor label) pairs of each atom
+    (Weisfeiler-Lehman refinement). Isomorphic graphs always have equal
+    invariants, so graphs with different invariants cannot be isomorphic.
+    The converse does not hold.
+
+    :param gra: the graph
+    :param niter: the number of refinement iterations
+    :type niter: int
+    :returns: the sorted atom labels
+    :rtype: tuple[int]
+    """
+    atm_dct = atoms(gra)
+    bnd_dct = bonds(gra)
+    ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+
+    lbl_dct = {k: hash(v) for k, v in atm_dct.items()}
+    for _ in range(niter):
+        lbl_dct = {
+            k: hash((lbl_dct[k], tuple(sorted(
+                (hash(bnd_dct[frozenset({k, n})]), lbl_dct[n])
+                for n in ngb_keys_dct[k]))))
+            for k in lbl_dct}
+
+    return tuple(sorted(lbl_dct.values()))
+
+
+def _networkx_isomorphic(nxg1, nxg2):
+    return _networkx.isomorphism(nxg1, nxg2) is not None
+
+
+def _unique_indices(itms, equiv, conv=None, inv=None):
+    """ indices of unique items from a list, according to binary comparison
+    `equiv`
+
+    if `conv` is given, each item is converted with it once up front and
+    `equiv` compares the converted items; if `inv` is given, `equiv` is only
+    called for items whose invariants `inv(itm)` are equal
     """
-    uniq_itms = []
-    for itm in itms:
-        if not any(map(functools.partial(equiv, itm), uniq_itms)):
-            uniq_itms.append(itm)
+    itms = tuple(itms)
+    cnvs = itms if conv is None else tuple(map(conv, itms))
+    invs = (None,) * len(itms) if inv is None else tuple(map(inv, itms))
+    uniq_idxs = []
+    for idx, (cnv, inv_) in enumerate(zip(cnvs, invs)):
+        if not any(invs[uniq_idx] == inv_ and equiv(cnv, cnvs[uniq_idx])
+                   for uniq_idx in uniq_idxs):
+            uniq_idxs.append(idx)
 
-    return tuple(uniq_itms)
+    return tuple(uniq_idxs)
 
 
 def equivalent_atoms(gra, atm_key, stereo=True, dummy=True):
@@ -495,22 +562,37 @@ def atom_longest_chain(gra, atm_key):
 
     chains_lst = []
     if atm_ngb_keys:
+        # track the atoms in each chain as a bitmask over the sorted atom keys,
+        # so that finding the unvisited neighbors of the chain end is a single
+        # bitwise operation; bits are visited in ascending order, matching the
+        # sorted order of the keys
+        keys = sorted(atm_ngb_keys_dct.keys())
+        bit_dct = {key: 1 << idx for idx, key in enumerate(keys)}
+        ngb_mask_dct = {
+            key: functools.reduce(operator.or_,
+                                  map(bit_dct.__getitem__, ngb_keys), 0)
+            for key, ngb_keys in atm_ngb_keys_dct.items()}
+
         next_chains_lst = [
-            [atm_key, atm_ngb_key] for atm_ngb_key in atm_ngb_keys]
+            ([atm_key, atm_ngb_key], bit_dct[atm_key] | bit_dct[atm_ngb_key])
+            for atm_ngb_key in atm_ngb_keys]
 
         while True:
             chains_lst = next_chains_lst
             next_chains_lst = []
-            for chain in chains_lst:
-                atm_ngb_keys = atm_ngb_keys_dct[chain[-1]]
-                next_atm_keys = sorted(atm_ngb_keys - set(chain))
-                for next_atm_key in next_atm_keys:
-                    next_chains_lst.append(chain + [next_atm_key])
+            for chain, chain_mask in chains_lst:
+                next_mask = ngb_mask_dct[chain[-1]] & ~chain_mask
+                while next_mask:
+                    bit = next_mask & -next_mask
+                    next_mask ^= bit
+                    next_atm_key = keys[bit.bit_length() - 1]
+                    next_chains_lst.append(
+                        (chain + [next_atm_key], chain_mask | bit))
 
             if not next_chains_lst:
                 break
 
-        max_chain = tuple(chains_lst[0])
+        max_chain = tuple(chains_lst[0][0])
     else:
         max_chain = tuple((atm_key,))
     return max_chain
@@ -355,7 +355,7 @@ def yaml_dictionary(gra, one_indexed=True):
 def from_string(gra_str, one_indexed=True):
     """ read the graph from a string
     """
-    yaml_gra_dct = yaml.load(gra_str, Loader=yaml.FullLoader)
+    yaml_gra_dct = yaml.load(gra_str, Loader=util.yaml_loader())
     gra = from_yaml_dictionary(yaml_gra_dct, one_indexed=one_indexed)
     return gra
 
@@ -666,20 +666,19 @@ def unsaturated_atom_keys(gra):
 
 def angle_keys(gra):
     """ triples of keys for pairs of adjacent bonds, with the central atom in
-    the middle
+    the middle, in sorted order
     """
-    bnd_keys = bond_keys(gra)
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
 
+    # enumerate the neighbor pairs of each central atom directly, rather than
+    # testing every pair of bonds for a shared atom
     ang_keys = []
-    for bnd_key1, bnd_key2 in itertools.combinations(bnd_keys, r=2):
-        if bnd_key1 != bnd_key2 and bnd_key1 & bnd_key2:
-            atm2_key, = bnd_key1 & bnd_key2
-            atm1_key, = bnd_key1 - {atm2_key}
-            atm3_key, = bnd_key2 - {atm2_key}
+    for atm2_key, atm_ngb_keys in atm_ngb_keys_dct.items():
+        for atm1_key, atm3_key in itertools.combinations(atm_ngb_keys, r=2):
             ang_keys.append((atm1_key, atm2_key, atm3_key))
             ang_keys.append((atm3_key, atm2_key, atm1_key))
 
-    return tuple(ang_keys)
+    return tuple(sorted(ang_keys))
 
 
 # # relabeling and changing keys
@@ -2,7 +2,6 @@
 
 BEFORE ADDING ANYTHING, SEE IMPORT HIERARCHY IN __init__.py!!!!
 """
-import itertools
 import functools
 import numpy
 from automol.util import dict_
@@ -42,9 +41,10 @@ def dominant_resonances(rgr):
     """
     rgr = without_fractional_bonds(rgr)
     rgrs = resonances(rgr)
-    mult_min = min(map(maximum_spin_multiplicity, rgrs))
+    mults = list(map(maximum_spin_multiplicity, rgrs))
+    mult_min = min(mults)
     dom_rgrs = tuple(
-        rgr for rgr in rgrs if maximum_spin_multiplicity(rgr) == mult_min)
+        rgr for rgr, mult in zip(rgrs, mults) if mult == mult_min)
     return dom_rgrs
 
 
@@ -58,34 +58,39 @@ def subresonances(rgr):
     """ this connected graph and its lower-spin (more pi-bonded) resonances
     """
     rgr = without_fractional_bonds(rgr)
+    atm_unsat_vlc_dct = atom_unsaturated_valences(rgr)
     # get the bond capacities (room for increasing bond order), filtering out
     # the negative ones to avoid complications with hypervalent atoms in TSs
-    bnd_cap_dct = dict_.by_value(_bond_capacities(rgr), lambda x: x > 0)
+    bnd_cap_dct = dict_.by_value(
+        _bond_capacities(rgr, atm_unsat_vlc_dct=atm_unsat_vlc_dct),
+        lambda x: x > 0)
 
     ret_rgrs = []
-    if bnd_cap_dct:
+    if bnd_cap_dct and max(bond_orders(rgr).values()) < 4:
         bnd_keys, bnd_caps = zip(*bnd_cap_dct.items())
         atm_keys = list(functools.reduce(frozenset.union, bnd_keys))
 
+        # Work with compact indices for the atoms involved, so that the search
+        # below only has to deal with small integer lists
+        atm_idx_dct = {atm_key: idx for idx, atm_key in enumerate(atm_keys)}
+        bnd_atm_idxs = [tuple(map(atm_idx_dct.__getitem__, bnd_key))
+                        for bnd_key in bnd_keys]
+        bnd_ords = dict_.values_by_key(bond_orders(rgr), bnd_keys)
+        atm_unsat_vlcs = dict_.values_by_key(atm_unsat_vlc_dct, atm_keys)
+
         # Loop over all possible combinations of bond order increments (amounts
-        # by which to increase the bond order), filtering out combinations that
+        # by which to increase the bond order), skipping combinations that
         # exceed the valences of the atoms involved.
         # (Note that we are only testing the bonds with available pi electrons,
         # so this is compatible with having hypervalent atoms elsewhere in the
         # molecule)
-        bnd_ord_inc_ranges = [range(bnd_cap+1) for bnd_cap in bnd_caps]
-        for bnd_ord_incs in itertools.product(*bnd_ord_inc_ranges):
-            bnd_ord_inc_dct = dict(zip(bnd_keys, bnd_ord_incs))
-            ret_rgr = _add_pi_bonds(rgr, bnd_ord_inc_dct)
-
-            max_bnd_ord = max(bond_orders(ret_rgr).values())
-
-            atm_unsat_vlcs = dict_.values_by_key(
-                atom_unsaturated_valences(ret_rgr), atm_keys)
-
-            if not any(atm_unsat_vlc < 0 for atm_unsat_vlc in atm_unsat_vlcs):
-                if max_bnd_ord < 4:
-                    ret_rgrs.append(ret_rgr)
+        # (the new bond orders for each combination are a single array sum
+        # over the bonds involved)
+        bnd_ord_arr = numpy.array(bnd_ords)
+        for bnd_ord_incs in _bond_order_increments(
+                bnd_caps, bnd_atm_idxs, bnd_ords, atm_unsat_vlcs):
+            bnd_ord_dct = dict(zip(bnd_keys, bnd_ord_arr + bnd_ord_incs))
+            ret_rgrs.append(set_bond_orders(rgr, bnd_ord_dct))
 
     if not ret_rgrs:
         ret_rgrs = (rgr,)
@@ -179,16 +184,20 @@ def linear_segments_atom_keys(gra, lin_keys=None):
             key, = lin_seg_keys
             lin_keys_lst.append([key])
         else:
+            ngb_keys_dct = atoms_neighbor_atom_keys(lin_seg)
             end_key1, end_key2 = sorted([
-                key for key, ngb_keys in
-                atoms_neighbor_atom_keys(lin_seg).items()
+                key for key, ngb_keys in ngb_keys_dct.items()
                 if len(ngb_keys) == 1])
-            ngb_keys_dct = atoms_neighbor_atom_keys(lin_seg)
 
-            key = None
+            # walk from one end to the other; each atom in the segment has at
+            # most two neighbors, so the next atom is whichever neighbor we
+            # did not just come from (no need to subtract the whole path)
+            key = end_key1
+            prev_key = None
             keys = [end_key1]
             while key != end_key2:
-                key, = ngb_keys_dct[keys[-1]] - set(keys)
+                next_key, = (k for k in ngb_keys_dct[key] if k != prev_key)
+                prev_key, key = key, next_key
                 keys.append(key)
             lin_keys_lst.append(keys)
 
@@ -449,11 +458,15 @@ def resonance_dominant_bond_centered_cumulene_keys(rgr):
 
 
 # # helpers
-def _bond_capacities(rgr):
+def _bond_capacities(rgr, atm_unsat_vlc_dct=None):
     """ the number of electron pairs available for further pi-bonding, by bond
+
+    :param atm_unsat_vlc_dct: the unsaturated valences of the atoms, if they
+        have already been determined
     """
     rgr = without_dummy_bonds(rgr)
-    atm_unsat_vlc_dct = atom_unsaturated_valences(rgr)
+    if atm_unsat_vlc_dct is None:
+        atm_unsat_vlc_dct = atom_unsaturated_valences(rgr)
 
     def _pi_capacities(bnd_key):
         return min(map(atm_unsat_vlc_dct.__getitem__, bnd_key))
@@ -464,19 +477,58 @@ def _bond_capacities(rgr):
     return bnd_cap_dct
 
 
-def _add_pi_bonds(rgr, bnd_ord_inc_dct):
-    """ add pi bonds to this graph
+def _bond_order_increments(bnd_caps, bnd_atm_idxs, bnd_ords, atm_unsat_vlcs):
+    """ valid combinations of bond order increments, by bond index
+
+    Combinations are generated in the same order as a product over the
+    capacity ranges, but the search is depth-first over the bonds, so that a
+    partial combination exceeding the unsaturated valence of one of its atoms
+    (or giving a bond order of four or more) is pruned with all of its
+    extensions, rather than being generated and then filtered out.
+
+    :param bnd_caps: the pi-bonding capacity of each bond
+    :param bnd_atm_idxs: the pair of atom indices for each bond
+    :param bnd_ords: the starting order of each bond
+    :param atm_unsat_vlcs: the unsaturated valence of each atom, by index
+    :returns: the bond order increments for each valid combination
+    :rtype: generator of tuple[int]
     """
-    bnd_keys = bond_keys(rgr)
-    assert set(bnd_ord_inc_dct.keys()) <= bnd_keys
-
-    bnd_keys = list(bnd_keys)
-    bnd_ords = dict_.values_by_key(bond_orders(rgr), bnd_keys)
-    bnd_ord_incs = dict_.values_by_key(bnd_ord_inc_dct, bnd_keys, fill_val=0)
-    new_bnd_ords = numpy.add(bnd_ords, bnd_ord_incs)
-    bnd_ord_dct = dict(zip(bnd_keys, new_bnd_ords))
-    rgr = set_bond_orders(rgr, bnd_ord_dct)
-    return rgr
+    nbnds = len(bnd_caps)
+    atm_unsat_vlcs = list(atm_unsat_vlcs)
+    bnd_ord_incs = [0] * nbnds
+    max_incs = [0] * nbnds
+
+    # The search is run over an explicit stack of bond indices, rather than by
+    # recursion, so that its depth is not capped by the recursion limit
+    bnd_idx = 0
+    descend = True
+    while bnd_idx >= 0:
+        if bnd_idx == nbnds:
+            yield tuple(bnd_ord_incs)
+            bnd_idx -= 1
+            descend = False
+            continue
+
+        idx1, idx2 = bnd_atm_idxs[bnd_idx]
+        if descend:
+            # start this bond with no increment
+            max_incs[bnd_idx] = min(
+                bnd_caps[bnd_idx], 3 - bnd_ords[bnd_idx],
+                atm_unsat_vlcs[idx1], atm_unsat_vlcs[idx2])
+            bnd_idx += 1
+        elif bnd_ord_incs[bnd_idx] < max_incs[bnd_idx]:
+            # try the next increment for this bond
+            bnd_ord_incs[bnd_idx] += 1
+            atm_unsat_vlcs[idx1] -= 1
+            atm_unsat_vlcs[idx2] -= 1
+            bnd_idx += 1
+            descend = True
+        else:
+            # all increments for this bond are done, so reset it and back up
+            atm_unsat_vlcs[idx1] += bnd_ord_incs[bnd_idx]
+            atm_unsat_vlcs[idx2] += bnd_ord_incs[bnd_idx]
+            bnd_ord_incs[bnd_idx] = 0
+            bnd_idx -= 1
 
 
 def _cumulene_chains(rgr):
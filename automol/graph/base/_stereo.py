@@ -41,51 +41,69 @@ def stereo_priority_vector(gra, atm_key, atm_ngb_key):
     """ generates a sortable one-to-one representation of the branch extending
     from `atm_key` through its bonded neighbor `atm_ngb_key`
     """
-    bbn_keys = backbone_keys(gra)
-    exp_hyd_keys = explicit_hydrogen_keys(gra)
-
-    if atm_ngb_key not in bbn_keys:
-        assert atm_ngb_key in exp_hyd_keys
-        assert frozenset({atm_key, atm_ngb_key}) in bond_keys(gra)
-        pri_vec = ()
-    else:
-        gra = implicit(gra)
-        atm_dct = atoms(gra)
-        bnd_dct = bonds(gra)
-        assert atm_key in bbn_keys
-        assert frozenset({atm_key, atm_ngb_key}) in bnd_dct
+    return _stereo_priority_vector_function(gra)(atm_key, atm_ngb_key)
 
-        # here, switch to an implicit graph
-        atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
 
-        def _priority_vector(atm1_key, atm2_key, seen_keys):
-            # we keep a list of seen keys to cut off cycles, avoiding infinite
-            # loops
+def _stereo_priority_vector_function(gra):
+    """ a function for generating stereo priority vectors for this graph
 
-            bnd_val = bnd_dct[frozenset({atm1_key, atm2_key})]
-            atm_val = atm_dct[atm2_key]
-
-            bnd_val = _replace_nones_with_negative_infinity(bnd_val)
-            atm_val = _replace_nones_with_negative_infinity(atm_val)
-
-            if atm2_key in seen_keys:
-                ret = (bnd_val,)
+    The graph-level lookups are done once here, so that the function can be
+    called for many atom/neighbor pairs of the same graph.
+    """
+    bbn_keys = backbone_keys(gra)
+    exp_hyd_keys = explicit_hydrogen_keys(gra)
+    exp_bnd_keys = bond_keys(gra)
+
+    # here, switch to an implicit graph
+    imp_gra = implicit(gra)
+    atm_dct = atoms(imp_gra)
+    bnd_dct = bonds(imp_gra)
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(imp_gra)
+
+    atm_val_dct = dict_.transform_values(
+        atm_dct, _replace_nones_with_negative_infinity)
+    # index the bonds by sorted key pairs, which are cheaper to build and hash
+    # than frozensets in the recursion below
+    bnd_val_dct = {tuple(sorted(bnd_key)):
+                   _replace_nones_with_negative_infinity(bnd_val)
+                   for bnd_key, bnd_val in bnd_dct.items()}
+
+    def _priority_vector(atm1_key, atm2_key, seen_keys):
+        # we keep a list of seen keys to cut off cycles, avoiding infinite
+        # loops
+
+        bnd_val = bnd_val_dct[(atm1_key, atm2_key) if atm1_key < atm2_key
+                              else (atm2_key, atm1_key)]
+        atm_val = atm_val_dct[atm2_key]
+
+        if atm2_key in seen_keys:
+            ret = (bnd_val,)
+        else:
+            seen_keys.update({atm1_key, atm2_key})
+            atm3_keys = atm_ngb_keys_dct[atm2_key] - {atm1_key}
+            if atm3_keys:
+                next_vals, seen_keys = zip(*[
+                    _priority_vector(atm2_key, atm3_key, seen_keys)
+                    for atm3_key in atm3_keys])
+                ret = (bnd_val, atm_val) + next_vals
             else:
-                seen_keys.update({atm1_key, atm2_key})
-                atm3_keys = atm_ngb_keys_dct[atm2_key] - {atm1_key}
-                if atm3_keys:
-                    next_vals, seen_keys = zip(*[
-                        _priority_vector(atm2_key, atm3_key, seen_keys)
-                        for atm3_key in atm3_keys])
-                    ret = (bnd_val, atm_val) + next_vals
-                else:
-                    ret = (bnd_val, atm_val)
+                ret = (bnd_val, atm_val)
+
+        return ret, seen_keys
 
-            return ret, seen_keys
+    def _stereo_priority_vector(atm_key, atm_ngb_key):
+        if atm_ngb_key not in bbn_keys:
+            assert atm_ngb_key in exp_hyd_keys
+            assert frozenset({atm_key, atm_ngb_key}) in exp_bnd_keys
+            pri_vec = ()
+        else:
+            assert atm_key in bbn_keys
+            assert frozenset({atm_key, atm_ngb_key}) in bnd_dct
+            pri_vec, _ = _priority_vector(atm_key, atm_ngb_key, set())
 
-        pri_vec, _ = _priority_vector(atm_key, atm_ngb_key, set())
+        return pri_vec
 
-    return pri_vec
+    return _stereo_priority_vector
 
 
 def stereogenic_atom_keys(gra, assigned=False):
@@ -108,10 +126,11 @@ def stereogenic_atom_keys(gra, assigned=False):
         atm_keys -= atom_stereo_keys(gra)
 
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    _priority_vector = _stereo_priority_vector_function(gra)
 
     def _is_stereogenic(atm_key):
         atm_ngb_keys = list(atm_ngb_keys_dct[atm_key])
-        pri_vecs = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+        pri_vecs = [_priority_vector(atm_key, atm_ngb_key)
                     for atm_ngb_key in atm_ngb_keys]
         ret = not any(pv1 == pv2
                       for pv1, pv2 in itertools.combinations(pri_vecs, r=2))
@@ -148,6 +167,7 @@ def stereogenic_bond_keys(gra, assigned=False):
         filter(lambda x: len(x) < 8, rings_bond_keys(gra)), frozenset())
 
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    _priority_vector = _stereo_priority_vector_function(gra)
 
     def _is_stereogenic(bnd_key):
         atm1_key, atm2_key = bnd_key
@@ -161,8 +181,8 @@ def stereogenic_bond_keys(gra, assigned=False):
                 ret = False
             else:
                 assert len(atm_ngb_keys) == 2   # C=C(-X)-Y
-                ret = (stereo_priority_vector(gra, atm_key, atm_ngb_keys[0]) ==
-                       stereo_priority_vector(gra, atm_key, atm_ngb_keys[1]))
+                ret = (_priority_vector(atm_key, atm_ngb_keys[0]) ==
+                       _priority_vector(atm_key, atm_ngb_keys[1]))
 
             return ret
 
@@ -181,28 +201,32 @@ def stereomers(gra):
     def _expand_atom_stereo(sgr):
         atm_ste_keys = stereogenic_atom_keys(sgr)
         nste_atms = len(atm_ste_keys)
-        sgrs = [set_atom_stereo_parities(sgr, dict(zip(atm_ste_keys,
+        return (set_atom_stereo_parities(sgr, dict(zip(atm_ste_keys,
                                                        atm_ste_par_vals)))
                 for atm_ste_par_vals
-                in itertools.product(bool_vals, repeat=nste_atms)]
-        return sgrs
+                in itertools.product(bool_vals, repeat=nste_atms))
 
     def _expand_bond_stereo(sgr):
         bnd_ste_keys = stereogenic_bond_keys(sgr)
         nste_bnds = len(bnd_ste_keys)
-        sgrs = [set_bond_stereo_parities(sgr, dict(zip(bnd_ste_keys,
+        return (set_bond_stereo_parities(sgr, dict(zip(bnd_ste_keys,
                                                        bnd_ste_par_vals)))
                 for bnd_ste_par_vals
-                in itertools.product(bool_vals, repeat=nste_bnds)]
-        return sgrs
+                in itertools.product(bool_vals, repeat=nste_bnds))
 
-    last_sgrs = []
+    last_nsgrs = 0
     sgrs = [without_stereo_parities(gra)]
 
-    while sgrs != last_sgrs:
-        last_sgrs = sgrs
-        sgrs = list(itertools.chain(*map(_expand_atom_stereo, sgrs)))
-        sgrs = list(itertools.chain(*map(_expand_bond_stereo, sgrs)))
+    # stream the atom and bond expansions, so that only the fully expanded
+    # graphs of each pass are held in memory
+    # (a pass either splits at least one graph into several or leaves them all
+    # unchanged, so comparing the counts is enough to detect convergence)
+    while len(sgrs) != last_nsgrs:
+        last_nsgrs = len(sgrs)
+        atm_sgrs = itertools.chain.from_iterable(
+            map(_expand_atom_stereo, sgrs))
+        sgrs = list(itertools.chain.from_iterable(
+            map(_expand_bond_stereo, atm_sgrs)))
 
     return tuple(sorted(sgrs, key=frozen))
 
@@ -372,8 +396,9 @@ def atom_stereo_sorted_neighbor_atom_keys(gra, atm_key, atm_ngb_keys):
 
     # explicitly create an object array because otherwise the argsort
     # interprets [()] as []
+    _priority_vector = _stereo_priority_vector_function(gra)
     atm_pri_vecs = numpy.empty(len(atm_ngb_keys), dtype=numpy.object_)
-    atm_pri_vecs[:] = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+    atm_pri_vecs[:] = [_priority_vector(atm_key, atm_ngb_key)
                        for atm_ngb_key in atm_ngb_keys]
 
     sort_idxs = numpy.argsort(atm_pri_vecs)
@@ -513,23 +513,27 @@ def substitutions(rct_gras, prd_gras):
     return ts_unique(rxns)
 
 
-def find(rct_gras, prd_gras):
+def find(rct_gras, prd_gras, limit=None):
     """ find all reactions consistent with these reactants and products
 
     :param rct_gras: graphs for the reactants, without stereo and without
         overlapping keys
     :param prd_gras: graphs for the products, without stereo and without
         overlapping keys
+    :param limit: if set, return at most this many reactions, skipping the
+        remaining finders once it is reached
+    :type limit: int
     :returns: a list of Reaction objects
     :rtype: tuple[Reaction]
     """
     # check whether this is a valid reaction
+    # (the formula strings are only built if the assertion fails)
     rct_fmls = list(map(formula, rct_gras))
     prd_fmls = list(map(formula, prd_gras))
-    rct_strs = list(map(automol.formula.string, rct_fmls))
-    prd_strs = list(map(automol.formula.string, prd_fmls))
     assert automol.formula.reac.is_valid_reaction(rct_fmls, prd_fmls), (
-        "Invalid reaction: {:s} -> {:s}".format(str(rct_strs), str(prd_strs)))
+        "Invalid reaction: {:s} -> {:s}".format(
+            str(list(map(automol.formula.string, rct_fmls))),
+            str(list(map(automol.formula.string, prd_fmls)))))
 
     # Cycle through the different finders and gather all possible reactions
     finders_ = [
@@ -546,7 +550,11 @@ def find(rct_gras, prd_gras):
         substitutions,
     ]
 
-    rxns = tuple(itertools.chain(*(f_(rct_gras, prd_gras) for f_ in finders_)))
+    # The finders are called lazily, so that later ones are skipped if the
+    # limit has already been reached
+    rxns = itertools.chain.from_iterable(
+        f_(rct_gras, prd_gras) for f_ in finders_)
+    rxns = tuple(itertools.islice(rxns, limit))
 
     return rxns
 
@@ -566,9 +574,12 @@ def find_from_inchis(rct_ichs, prd_ichs):
     rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
     prd_gras, _ = automol.graph.standard_keys_for_sequence(prd_gras)
     rxns = find(rct_gras, prd_gras)
-    rxn_classes = [rxn.class_ for rxn in rxns]
-    rxn_classes = [c for i, c in enumerate(rxn_classes)
-                   if c not in rxn_classes[:i]]
+    rxn_classes = []
+    seen_classes = set()
+    for rxn in rxns:
+        if rxn.class_ not in seen_classes:
+            seen_classes.add(rxn.class_)
+            rxn_classes.append(rxn.class_)
     return tuple(rxn_classes)
 
 
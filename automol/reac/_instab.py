@@ -58,7 +58,7 @@ def instability_transformation(conn_zma, disconn_zmas):
     """ Build the reaction objects for an instability
     """
     zrxn_objs = rxn_objs_from_zmatrix(
-        [conn_zma], disconn_zmas, indexing='zma')
+        [conn_zma], disconn_zmas, indexing='zma', limit=1)
     if zrxn_objs:
         zrxn, zma, _, _ = zrxn_objs[0]
     else:
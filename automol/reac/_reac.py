@@ -32,6 +32,10 @@ class Reaction:
     :type products_keys: tuple[tuple[int]]
     """
 
+    # Fixed attribute set; avoids a per-instance __dict__
+    __slots__ = ('class_', 'reactants_keys', 'products_keys',
+                 'forward_ts_graph', 'backward_ts_graph')
+
     def __init__(self, rxn_cls, forw_tsg, back_tsg, rcts_keys, prds_keys):
         """ constructor
         """
@@ -103,15 +107,29 @@ class Reaction:
 
     def copy(self):
         """ return a copy of this Reaction
+
+        (the attributes were already checked on construction, so they are
+        copied over directly rather than re-validated)
         """
-        return Reaction(
-            self.class_, self.forward_ts_graph, self.backward_ts_graph,
-            self.reactants_keys, self.products_keys)
+        rxn = Reaction.__new__(Reaction)
+        rxn.class_ = self.class_
+        rxn.reactants_keys = self.reactants_keys
+        rxn.products_keys = self.products_keys
+        rxn.forward_ts_graph = self.forward_ts_graph
+        rxn.backward_ts_graph = self.backward_ts_graph
+        return rxn
 
     def has_standard_keys(self):
         """ Does this reaction have standard keys?
+
+        (equivalent to `self == standard_keys(self)`, which holds exactly when
+        the reactant and product keys run in order from zero, but without
+        building and validating the standardized reaction)
         """
-        return self == standard_keys(self)
+        rct_keys = tuple(itertools.chain(*self.reactants_keys))
+        prd_keys = tuple(itertools.chain(*self.products_keys))
+        return (rct_keys == tuple(range(len(rct_keys))) and
+                prd_keys == tuple(range(len(prd_keys))))
 
     def __eq__(self, other):
         """ equality operator
@@ -174,7 +192,7 @@ def from_string(rxn_str, one_indexed=True):
         :type one_indexed: bool
         :rtype: Reaction
     """
-    yaml_dct = yaml.load(rxn_str, Loader=yaml.FullLoader)
+    yaml_dct = yaml.load(rxn_str, Loader=automol.util.yaml_loader())
 
     rxn_cls = yaml_dct['reaction class']
     rcts_keys = yaml_dct['reactants keys']
@@ -643,18 +661,10 @@ def ts_unique(rxns):
     :param rxns: a sequence of reaction objects
     :returns: unique reaction objects
     """
-    all_rxns = rxns
-    rxns = []
-
-    def _isomorphism(rxn1, rxn2):
-        return automol.graph.full_isomorphism(rxn1.forward_ts_graph,
-                                              rxn2.forward_ts_graph)
-
-    for rxn in all_rxns:
-        if not any(_isomorphism(rxn, r) for r in rxns):
-            rxns.append(rxn)
-
-    return tuple(rxns)
+    rxns = tuple(rxns)
+    tsgs = [rxn.forward_ts_graph for rxn in rxns]
+    idxs = automol.graph.full_unique_indices(tsgs)
+    return tuple(rxns[idx] for idx in idxs)
 
 
 def filter_viable_reactions(rxns):
@@ -672,22 +682,23 @@ def filter_viable_reactions(rxns):
     all_rxns = rxns
     rxns = []
 
-    def _produces_separated_radical_sites(rxn):
-        prd_gras = product_graphs(rxn)
+    def _produces_separated_radical_sites(prd_gras):
         sep_rad = any(automol.graph.has_separated_radical_sites(prd_gra)
                       for prd_gra in prd_gras)
         return sep_rad
 
-    def _high_spin_products(rxn):
-        prd_gras = product_graphs(rxn)
+    def _high_spin_products(prd_gras):
         mult = sum(map(automol.graph.maximum_spin_multiplicity,
                        map(automol.graph.dominant_resonance, prd_gras)))
         return mult > 3
 
     for rxn in all_rxns:
+        # Extract the product graphs once and share them between the checks
+        prd_gras = product_graphs(rxn)
+
         # Check for separated radical sites
-        sep_rad = _produces_separated_radical_sites(rxn)
-        hi_spin = _high_spin_products(rxn)
+        sep_rad = _produces_separated_radical_sites(prd_gras)
+        hi_spin = _high_spin_products(prd_gras)
 
         # Add more conditions here, as needed ...
 
@@ -1,5 +1,6 @@
 """ stereo functionality for reaction objects
 """
+from concurrent.futures import ProcessPoolExecutor
 import automol.graph
 from automol.reac._reac import Reaction
 from automol.reac._reac import reverse
@@ -53,29 +54,39 @@ def add_stereo_from_geometries(rxn, rct_geos, prd_geos):
     return srxn
 
 
-def expand_stereo(rxn):
+def expand_stereo(rxn, nprocs=1):
     """ Expand all possible stereo assignments for the reactants and products
     of this reaction. Only includes possibilities that are mutually consistent
     with each other.
 
     :param rxn: a reaction object
     :type rxn: Reaction
+    :param nprocs: the number of processes over which to split the forward
+        stereomers when finding their compatible reverse stereomers
+    :type nprocs: int
     :returns: a sequence reaction objects with stereo assignments
     :rtype: Reaction
     """
-    rxn_cls = rxn.class_
     forw_tsg = rxn.forward_ts_graph
     back_tsg = rxn.backward_ts_graph
-    rcts_keys = rxn.reactants_keys
-    prds_keys = rxn.products_keys
 
     key_dct = atom_mapping(rxn)
 
     forw_ste_tsgs = ts.stereomers(forw_tsg)
 
+    # the reverse stereomers for each forward stereomer are independent of
+    # each other, so they can be found in parallel
+    if nprocs > 1 and len(forw_ste_tsgs) > 1:
+        with ProcessPoolExecutor(max_workers=nprocs) as executor:
+            back_ste_tsgs_lst = list(executor.map(
+                ts.compatible_reverse_stereomers, forw_ste_tsgs))
+    else:
+        back_ste_tsgs_lst = map(ts.compatible_reverse_stereomers,
+                                forw_ste_tsgs)
+
     srxns = []
-    for forw_ste_tsg in forw_ste_tsgs:
-        for back_ste_tsg in ts.compatible_reverse_stereomers(forw_ste_tsg):
+    for forw_ste_tsg, back_ste_tsgs in zip(forw_ste_tsgs, back_ste_tsgs_lst):
+        for back_ste_tsg in back_ste_tsgs:
             back_ste_tsg = automol.graph.relabel(back_ste_tsg, key_dct)
 
             # But for dummy atoms, we could just do the conversion directly,
@@ -85,8 +96,10 @@ def expand_stereo(rxn):
             back_ste_tsg = automol.graph.set_bond_stereo_parities(
                 back_tsg, automol.graph.bond_stereo_parities(back_ste_tsg))
 
-            srxn = Reaction(rxn_cls, forw_ste_tsg, back_ste_tsg,
-                            rcts_keys, prds_keys)
+            # only the stereo parities differ, so copy rather than re-validate
+            srxn = rxn.copy()
+            srxn.forward_ts_graph = forw_ste_tsg
+            srxn.backward_ts_graph = back_ste_tsg
             srxns.append(srxn)
 
     srxns = tuple(srxns)
@@ -103,10 +116,7 @@ def expand_product_stereo(srxn):
     :returns: a sequence reaction objects with stereo assignments
     :rtype: Reaction
     """
-    rxn_cls = srxn.class_
     back_tsg = srxn.backward_ts_graph
-    rcts_keys = srxn.reactants_keys
-    prds_keys = srxn.products_keys
 
     key_dct = atom_mapping(srxn)
 
@@ -123,9 +133,11 @@ def expand_product_stereo(srxn):
         back_ste_tsg = automol.graph.set_bond_stereo_parities(
             back_tsg, automol.graph.bond_stereo_parities(back_ste_tsg))
 
-        srxn = Reaction(rxn_cls, forw_ste_tsg, back_ste_tsg,
-                        rcts_keys, prds_keys)
-        srxns.append(srxn)
+        # only the stereo parities differ, so copy rather than re-validate
+        srxn_ = srxn.copy()
+        srxn_.forward_ts_graph = forw_ste_tsg
+        srxn_.backward_ts_graph = back_ste_tsg
+        srxns.append(srxn_)
 
     srxns = tuple(srxns)
     return srxns
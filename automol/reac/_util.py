@@ -175,7 +175,7 @@ def reaction_inchis(rxn, stereo=True):
 
 
 # Get a reaction object from various identifiers
-def rxn_objs_from_inchi(rct_ichs, prd_ichs, indexing='geo'):
+def rxn_objs_from_inchi(rct_ichs, prd_ichs, indexing='geo', limit=None):
     """ Generate obj
     """
 
@@ -183,25 +183,25 @@ def rxn_objs_from_inchi(rct_ichs, prd_ichs, indexing='geo'):
     prd_geos = list(map(automol.inchi.geometry, prd_ichs))
 
     return rxn_objs_from_geometry(
-        rct_geos, prd_geos, indexing=indexing)
+        rct_geos, prd_geos, indexing=indexing, limit=limit)
 
 
-def rxn_objs_from_smiles(rct_smis, prd_smis, indexing='geo'):
+def rxn_objs_from_smiles(rct_smis, prd_smis, indexing='geo', limit=None):
     """ Generate obj
     """
 
     # Is this adding stero? prob should?
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    prd_ichs = list(map(automol.smiles.inchi, prd_smis))
+    rct_ichs = map(automol.smiles.inchi, rct_smis)
+    prd_ichs = map(automol.smiles.inchi, prd_smis)
 
     rct_geos = list(map(automol.inchi.geometry, rct_ichs))
     prd_geos = list(map(automol.inchi.geometry, prd_ichs))
 
     return rxn_objs_from_geometry(
-        rct_geos, prd_geos, indexing=indexing)
+        rct_geos, prd_geos, indexing=indexing, limit=limit)
 
 
-def rxn_objs_from_zmatrix(rct_zmas, prd_zmas, indexing='geo'):
+def rxn_objs_from_zmatrix(rct_zmas, prd_zmas, indexing='geo', limit=None):
     """ Generate rxn obj
     """
 
@@ -209,10 +209,10 @@ def rxn_objs_from_zmatrix(rct_zmas, prd_zmas, indexing='geo'):
     prd_geos = list(map(automol.zmat.geometry, prd_zmas))
 
     return rxn_objs_from_geometry(
-        rct_geos, prd_geos, indexing=indexing)
+        rct_geos, prd_geos, indexing=indexing, limit=limit)
 
 
-def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
+def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo', limit=None):
     """ from
     """
 
@@ -225,7 +225,14 @@ def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
     rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
     prd_gras, _ = automol.graph.standard_keys_for_sequence(prd_gras)
 
-    rxns = automol.reac.find(rct_gras, prd_gras)
+    rxns = automol.reac.find(rct_gras, prd_gras, limit=limit)
+
+    # The reagent z-matrices are the same for every reaction, so build them
+    # once up front
+    rct_zmas = prd_zmas = None
+    if indexing == 'zma' and rxns:
+        rct_zmas = tuple(map(automol.geom.zmatrix, rct_geos))
+        prd_zmas = tuple(map(automol.geom.zmatrix, prd_geos))
 
     # Obtain the reaction objects and structures to return
     rxn_objs = tuple()
@@ -243,8 +250,6 @@ def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
                 std_rxn, ts_geo)
             std_zrxn = automol.reac.relabel_for_zmatrix(
                 std_rxn, zma_keys, dummy_key_dct)
-            rct_zmas = tuple(map(automol.geom.zmatrix, rct_geos))
-            prd_zmas = tuple(map(automol.geom.zmatrix, prd_geos))
 
             rxn_objs += ((std_zrxn, ts_zma, rct_zmas, prd_zmas),)
 
@@ -2,7 +2,6 @@
  New Tunneling Equtions
 """
 
-import math
 import numpy
 from phydat import phycon
 
@@ -12,9 +11,8 @@ def transmission_coefficient(enes, valpha, rxn_freq):
     """ Calculate the tunneling transmission coefficients at Es.
     """
 
-    kes = ()
-    for ene in enes:
-        kes += (_transmission_coefficient(ene, valpha, rxn_freq),)
+    enes = numpy.asarray(enes, dtype=numpy.float64)
+    kes = tuple(_transmission_coefficient(enes, valpha, rxn_freq))
 
     return kes
 
@@ -23,9 +21,8 @@ def action(enes, valpha, rxn_freq):
     """ Calculate action at seve
     """
 
-    ses = ()
-    for ene in enes:
-        ses += (_action(ene, valpha, rxn_freq),)
+    enes = numpy.asarray(enes, dtype=numpy.float64)
+    ses = tuple(_action(enes, valpha, rxn_freq))
 
     return ses
 
@@ -33,15 +30,19 @@ def action(enes, valpha, rxn_freq):
 def _transmission_coefficient(ene, valpha, rxn_freq):
     """ Calculate the tunneling transmission coefficient at some energy.
 
+        Evaluated elementwise if `ene` is an array of energies.
+
         :param ene: energy to calculate the transmission coefficient
         :param alpha: alpha coefficient in S(E) expansion
         :param rxn_freq: frequency of the reaction mode
     """
 
-    if ene < 0.0:
-        denom = math.exp(action(-1.0*ene, valpha, rxn_freq))
-    else:
-        denom = (-2.0 * numpy.pi * ene) / rxn_freq
+    # (the action is only taken for the negative energies, so that the
+    # exponential of the unused branch cannot overflow)
+    denom = numpy.where(
+        ene < 0.0,
+        numpy.exp(_action(-numpy.minimum(ene, 0.0), valpha, rxn_freq)),
+        (-2.0 * numpy.pi * ene) / rxn_freq)
 
     p_e = 1.0 / (1.0 + denom)
 
@@ -50,6 +51,8 @@ def _transmission_coefficient(ene, valpha, rxn_freq):
 
 def _action(ene, valpha, rxn_freq):
     """ Tunneling action as a second-order expansion of the energy
+
+        Evaluated elementwise if `ene` is an array of energies.
     """
 
     rxn_freq *= phycon.WAVEN2EH
@@ -26,7 +26,6 @@ def from_zmatrix(zma, zrxn=None, tors_names=None, multi=False):
     if zrxn is None:
         # Build a graph that is used to get torsion object info
         gra, lin_keys = graph_with_keys(zma, zrxn=zrxn)
-        print('lin keys back here', lin_keys)
         # Build the torsion objects
         tors_lst = tors.torsion_lst(zma, gra, lin_keys)
     else:
@@ -192,7 +191,7 @@ def from_string(tors_str):
 
     inf_dct = {}
 
-    tors_dct = yaml.load(tors_str, Loader=yaml.FullLoader)
+    tors_dct = yaml.load(tors_str, Loader=automol.util.yaml_loader())
     for name, dct in tors_dct.items():
         _axis = (dct['axis1']-1, dct['axis2']-1)
         _grps = (_decode_idxs(dct['group1']), _decode_idxs(dct['group2']))
@@ -0,0 +1,9 @@
+""" pytest configuration for the automol tests
+"""
+
+
+def pytest_configure(config):
+    """ register the custom markers used in these tests
+    """
+    config.addinivalue_line(
+        'markers', 'slow: long-running test (deselect with -m "not slow")')
@@ -206,6 +206,7 @@ def test__graph__misc():
     conn_gra = automol.geom.connectivity_graph(
         automol.inchi.geometry(ref_ich))
     assert conn_gra == ref_conn_gra
+    assert automol.geom.connectivity_graph(()) == ({}, {})
 
     ref_geo = (
         ('C', (0.0, 0.0, 0.0)),
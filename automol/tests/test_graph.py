@@ -2,6 +2,7 @@
 """
 
 import numpy
+import pytest
 import automol
 from automol import graph
 
@@ -549,6 +550,23 @@ def test__backbone_unique():
     assert graph.backbone_unique(C3H3_RGRS) == C3H3_RGRS[:2]
 
 
+def test__isomorphism_invariant():
+    """ test graph.isomorphism_invariant
+    """
+    cgr = C8H13O_CGR
+    inv = graph.isomorphism_invariant(cgr)
+    natms = len(graph.atoms(cgr))
+    rng = numpy.random.RandomState(0)
+    for _ in range(10):
+        pmt_dct = dict(enumerate(rng.permutation(natms)))
+        cgr_pmt = graph.relabel(cgr, pmt_dct)
+        assert graph.isomorphism_invariant(cgr_pmt) == inv
+
+    invs = list(map(graph.isomorphism_invariant, C3H3_RGRS))
+    assert invs[0] != invs[1]
+    assert invs[1] == invs[2] == invs[3]
+
+
 # chemistry library
 def test__atom_element_valences():
     """ test graph.atom_element_valences
@@ -911,6 +929,7 @@ def test__ts__nonconserved_bond_stereo_keys():
         (frozenset(), frozenset({frozenset({0, 1})})))
 
 
+@pytest.mark.slow
 def test__ts__compatible_reverse_stereomers():
     """ test graph.ts.stereo_expand_reverse_graphs
     """
@@ -1,6 +1,7 @@
 """ test automol.inchi
 """
 import numpy
+import pytest
 from automol import inchi
 
 AR_ICH = 'InChI=1S/Ar'
@@ -150,6 +151,7 @@ def test__recalculate():
     # assert inchi.recalculate(CH4O_CH_ICH) == CH4O_CH_ICH
 
 
+@pytest.mark.slow
 def test__expand_stereo():
     """ inchi.expand_stereo
     """
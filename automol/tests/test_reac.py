@@ -1,6 +1,9 @@
 """ test automol.reac
 """
 
+import os
+import functools
+import pytest
 import automol
 
 SUBSTITUTION_RXN_STR = """
@@ -129,19 +132,59 @@ products keys:
 - [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
 """
 
+# Reaction objects for the strings above, parsed once for the tests below
+SUBSTITUTION_RXN = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+MIGRATION_RXN = automol.reac.from_string(MIGRATION_RXN_STR)
+
+
+@functools.lru_cache(maxsize=None)
+def _geometry(smi):
+    """ geometry from smiles, cached so that each species is embedded once
+    """
+    return automol.inchi.geometry(automol.smiles.inchi(smi))
+
+
+def _rxn_objs_from_smiles(rct_smis, prd_smis, **kwargs):
+    """ reac.rxn_objs_from_smiles, using the cached geometries
+
+    reactions run in both directions (e.g. beta scission and addition) share
+    their reagent geometries this way
+    """
+    rct_geos = list(map(_geometry, rct_smis))
+    prd_geos = list(map(_geometry, prd_smis))
+    return automol.reac.rxn_objs_from_geometry(rct_geos, prd_geos, **kwargs)
+
+
+# Set this to print the stereo InChIs of the reactions in test__stereo
+VERBOSE = bool(os.environ.get('AUTOMOL_TEST_VERBOSE'))
+
+
+def _print_stereo_inchis(srxns):
+    """ print the reactant and product stereo inchis for each reaction
+
+    skipped unless VERBOSE is set, since the InChI conversions take longer
+    than the stereo expansions being tested
+    """
+    if not VERBOSE:
+        return
+
+    for srxn in srxns:
+        rct_gras = automol.reac.reactant_graphs(srxn)
+        prd_gras = automol.reac.product_graphs(srxn)
+        rct_ichs = list(map(automol.graph.stereo_inchi, rct_gras))
+        prd_ichs = list(map(automol.graph.stereo_inchi, prd_gras))
+        print(rct_ichs)
+        print(prd_ichs)
+        print()
+
+
 # ZMA Bank
-C4H10_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('CCCC')))
-OH_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('[OH]')))
-H_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('[H]')))
-CCCCCH2_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('CCCC[CH2]')))
-CH2CCH2_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('C=C=C')))
-CH3CH2CH2O_ZMA = automol.geom.zmatrix(
-    automol.inchi.geometry(automol.smiles.inchi('CCC[O]')))
+C4H10_ZMA = automol.geom.zmatrix(_geometry('CCCC'))
+OH_ZMA = automol.geom.zmatrix(_geometry('[OH]'))
+H_ZMA = automol.geom.zmatrix(_geometry('[H]'))
+CCCCCH2_ZMA = automol.geom.zmatrix(_geometry('CCCC[CH2]'))
+CH2CCH2_ZMA = automol.geom.zmatrix(_geometry('C=C=C'))
+CH3CH2CH2O_ZMA = automol.geom.zmatrix(_geometry('CCC[O]'))
 
 
 def test__reac__string():
@@ -155,7 +198,7 @@ def test__reac__string():
 def test__reac__forming_bond_keys():
     """ test reac.forming_bond_keys
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert (automol.reac.forming_bond_keys(rxn) ==
             frozenset({frozenset({1, 7})}))
     assert (automol.reac.forming_bond_keys(rxn, rev=True) ==
@@ -165,7 +208,7 @@ def test__reac__forming_bond_keys():
 def test__reac__breaking_bond_keys():
     """ test reac.breaking_bond_keys
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert (automol.reac.breaking_bond_keys(rxn) ==
             frozenset({frozenset({0, 1})}))
     assert (automol.reac.breaking_bond_keys(rxn, rev=True) ==
@@ -175,7 +218,7 @@ def test__reac__breaking_bond_keys():
 def test__reac__forming_rings_atom_keys():
     """ test reac.forming_rings_atom_keys
     """
-    rxn = automol.reac.from_string(MIGRATION_RXN_STR)
+    rxn = MIGRATION_RXN
     assert automol.reac.forming_rings_atom_keys(rxn) == (
         (0, 1, 4, 5, 6),
     )
@@ -187,7 +230,7 @@ def test__reac__forming_rings_atom_keys():
 def test__reac__forming_rings_bond_keys():
     """ test reac.forming_rings_bond_keys
     """
-    rxn = automol.reac.from_string(MIGRATION_RXN_STR)
+    rxn = MIGRATION_RXN
     assert automol.reac.forming_rings_bond_keys(rxn) == (
         frozenset({frozenset({1, 4}), frozenset({0, 6}), frozenset({4, 5}),
                    frozenset({0, 1}), frozenset({5, 6})}),
@@ -201,7 +244,7 @@ def test__reac__forming_rings_bond_keys():
 def test__reac__breaking_rings_atom_keys():
     """ test reac.breaking_rings_atom_keys
     """
-    rxn = automol.reac.from_string(MIGRATION_RXN_STR)
+    rxn = MIGRATION_RXN
     assert automol.reac.breaking_rings_atom_keys(rxn) == (
         (0, 1, 4, 5, 6),
     )
@@ -213,7 +256,7 @@ def test__reac__breaking_rings_atom_keys():
 def test__reac__breaking_rings_bond_keys():
     """ test reac.breaking_rings_bond_keys
     """
-    rxn = automol.reac.from_string(MIGRATION_RXN_STR)
+    rxn = MIGRATION_RXN
     assert automol.reac.breaking_rings_bond_keys(rxn) == (
         frozenset({frozenset({1, 4}), frozenset({0, 6}), frozenset({4, 5}),
                    frozenset({0, 1}), frozenset({5, 6})}),
@@ -227,7 +270,7 @@ def test__reac__breaking_rings_bond_keys():
 def test__reac__reactant_graphs():
     """ test reac.reactant_graphs
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert automol.reac.reactant_graphs(rxn) == (
         ({0: ('O', 0, None), 1: ('C', 0, None), 2: ('H', 0, None),
           3: ('X', 0, None), 4: ('H', 0, None), 5: ('H', 0, None),
@@ -247,7 +290,7 @@ def test__reac__reactant_graphs():
 def test__reac__product_graphs():
     """ test reac.product_graphs
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert automol.reac.product_graphs(rxn) == (
         ({0: ('C', 0, None), 1: ('C', 0, None), 2: ('C', 0, None),
           3: ('H', 0, None), 4: ('H', 0, None), 5: ('H', 0, None),
@@ -266,7 +309,7 @@ def test__reac__product_graphs():
 def test__reac__reactants_graph():
     """ test reac.reactants_graph
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert automol.reac.reactants_graph(rxn) == (
         {0: ('O', 0, None), 1: ('C', 0, None), 2: ('H', 0, None),
          3: ('X', 0, None), 4: ('H', 0, None), 5: ('H', 0, None),
@@ -285,7 +328,7 @@ def test__reac__reactants_graph():
 def test__reac__products_graph():
     """ test reac.product_graphs
     """
-    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn = SUBSTITUTION_RXN
     assert automol.reac.products_graph(rxn) == (
         {0: ('C', 0, None), 1: ('C', 0, None), 2: ('C', 0, None),
          3: ('H', 0, None), 4: ('H', 0, None), 5: ('H', 0, None),
@@ -307,7 +350,7 @@ def test__reac__hydrogen_migration():
     rct_smis = ['CCCO[O]']
     prd_smis = ['C[CH]COO']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -365,7 +408,7 @@ def test__reac__2ts_hydrogen_migration():
     rct_smis = ['CCC[CH2]']
     prd_smis = ['CC[CH]C']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis)
 
     # Deal with rxn object 1
     rxn1, ts_geo1, _, _ = rxn_objs[0]
@@ -414,7 +457,7 @@ def test__reac__beta_scission():
     rct_smis = ['CCCO[O]']
     prd_smis = ['[O][O]', 'CC[CH2]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -472,7 +515,7 @@ def test__reac__ring_forming_scission():
     rct_smis = ['[CH2]CCCOO']
     prd_smis = ['C1CCCO1', '[OH]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -527,7 +570,7 @@ def test__reac__elimination():
     rct_smis = ['CCCO[O]']
     prd_smis = ['CC=C', 'O[O]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -580,7 +623,7 @@ def test__reac__elimination():
         (['CCC'], ['CC', '[CH2]']),
     ]
     for rct_smis, prd_smis in rxn_smis_lst:
-        rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+        rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
         rxn, geo, _, _ = rxn_objs[0]
 
         # reaction object aligned to z-matrix keys
@@ -625,7 +668,7 @@ def test__reac__hydrogen_abstraction():
     rct_smis = ['CCO', '[CH3]']
     prd_smis = ['[CH2]CO', 'C']
     
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -685,7 +728,7 @@ def test__reac__hydrogen_abstraction():
         # (['[O]O', 'CCC=C[CH]CCCCC'], ['O=O', 'CCCC=CCCCCC']),
     ]
     for rct_smis, prd_smis in rxn_smis_lst:
-        rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+        rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
         rxn, geo, _, _ = rxn_objs[0]
 
         # reaction object aligned to z-matrix keys
@@ -730,7 +773,7 @@ def test__reac__sigma_hydrogen_abstraction():
     rct_smis = ['CCO', 'C#[C]']
     prd_smis = ['CC[O]', 'C#C']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -777,7 +820,7 @@ def test__reac__addition():
     rct_smis = ['CC[CH2]', '[O][O]']
     prd_smis = ['CCCO[O]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis)
     print(len(rxn_objs))
     # rxn, geo, _, _ = rxn_objs[0]
 
@@ -837,7 +880,7 @@ def test__reac__addition():
         (['C=CCCCCCC', '[CH2]C'], ['CCC[CH]CCCCCC']),
     ]
     for rct_smis, prd_smis in rxn_smis_lst:
-        rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+        rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis)
         rxn, rct_geos, _, _ = rxn_objs[0]
         print(rct_geos)
         geo = automol.reac.ts_geometry(rxn, rct_geos, log=False)
@@ -884,7 +927,7 @@ def test__reac__radrad_addition():
     rct_smis = ['CC[CH2]', '[H]']
     prd_smis = ['CCC']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -902,7 +945,7 @@ def test__reac__radrad_hydrogen_abstraction():
     # rct_smis = ['CC[CH2]', '[H]']
     # prd_smis = ['CC=C', '[HH]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -963,7 +1006,7 @@ def test__reac__insertion():
     rct_smis = ['CC=C', 'O[O]']
     prd_smis = ['CCCO[O]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -1016,7 +1059,7 @@ def test__reac__insertion():
         (['CC', '[CH2]'], ['CCC']),
     ]
     for rct_smis, prd_smis in rxn_smis_lst:
-        rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+        rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
         rxn, geo, _, _ = rxn_objs[0]
 
         # reaction object aligned to z-matrix keys
@@ -1062,7 +1105,7 @@ def test__reac__substitution():
     rct_smis = ['CO', '[CH2]C']
     prd_smis = ['CCC', '[OH]']
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, geo, _, _ = rxn_objs[0]
 
     # reaction object aligned to z-matrix keys
@@ -1130,7 +1173,7 @@ def test__reac_util():
     zrxn1 = automol.reac.relabel_for_zmatrix(rxn, zma_keys1, dummy_key_dct1)
 
     zrxn_objs = automol.reac.rxn_objs_from_smiles(
-        rct_smis, prd_smis, indexing='zma')
+        rct_smis, prd_smis, indexing='zma', limit=1)
     zrxn2, _, _, _ = zrxn_objs[0]
 
     assert zrxn1 == zrxn2
@@ -1207,6 +1250,7 @@ def test__mult():
     assert automol.mult.spin(mult) == 2
 
 
+@pytest.mark.slow
 def test__stereo():
     """ test stereo functionality
     """
@@ -1215,7 +1259,7 @@ def test__stereo():
     prd_smis = ['FC(O)[C](C(O)F)C(O)F']
     print("Reaction:", rct_smis, "=>", prd_smis)
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, _, rct_geos, prd_geos = rxn_objs[0]
 
     # Complete stereo expansion for the reaction
@@ -1223,14 +1267,7 @@ def test__stereo():
     print(len(srxns))
     assert len(srxns) == 16
     print("Complete stereo expansion for the reaction:")
-    for srxn in srxns:
-        rct_gras = automol.reac.reactant_graphs(srxn)
-        prd_gras = automol.reac.product_graphs(srxn)
-        rct_ichs = list(map(automol.graph.stereo_inchi, rct_gras))
-        prd_ichs = list(map(automol.graph.stereo_inchi, prd_gras))
-        print(rct_ichs)
-        print(prd_ichs)
-        print()
+    _print_stereo_inchis(srxns)
 
     # Assign reactant and product stereo from geometries.
     srxn = automol.reac.add_stereo_from_geometries(rxn, rct_geos, prd_geos)
@@ -1243,21 +1280,14 @@ def test__stereo():
     print(len(srxns))
     assert len(srxns) == 2
     print("Product expansion for reactant geometry stereo assignments:")
-    for srxn in srxns:
-        rct_gras = automol.reac.reactant_graphs(srxn)
-        prd_gras = automol.reac.product_graphs(srxn)
-        rct_ichs = list(map(automol.graph.stereo_inchi, rct_gras))
-        prd_ichs = list(map(automol.graph.stereo_inchi, prd_gras))
-        print(rct_ichs)
-        print(prd_ichs)
-        print()
+    _print_stereo_inchis(srxns)
 
     # example 2
     rct_smis = ['FC=CC=CF', '[OH]']
     prd_smis = ['FC=C[CH]C(O)F']
     print("Reaction:", rct_smis, "=>", prd_smis)
 
-    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn_objs = _rxn_objs_from_smiles(rct_smis, prd_smis, limit=1)
     rxn, _, rct_geos, prd_geos = rxn_objs[0]
 
     # Complete stereo expansion for the reaction
@@ -1265,14 +1295,7 @@ def test__stereo():
     print(len(srxns))
     assert len(srxns) == 16
     print("Complete stereo expansion for the reaction:")
-    for srxn in srxns:
-        rct_gras = automol.reac.reactant_graphs(srxn)
-        prd_gras = automol.reac.product_graphs(srxn)
-        rct_ichs = list(map(automol.graph.stereo_inchi, rct_gras))
-        prd_ichs = list(map(automol.graph.stereo_inchi, prd_gras))
-        print(rct_ichs)
-        print(prd_ichs)
-        print()
+    _print_stereo_inchis(srxns)
 
     # Assign reactant and product stereo from geometries.
     srxn = automol.reac.add_stereo_from_geometries(rxn, rct_geos, prd_geos)
@@ -1285,149 +1308,43 @@ def test__stereo():
     print(len(srxns))
     assert len(srxns) == 4
     print("Product expansion for reactant geometry stereo assignments:")
-    for srxn in srxns:
-        rct_gras = automol.reac.reactant_graphs(srxn)
-        prd_gras = automol.reac.product_graphs(srxn)
-        rct_ichs = list(map(automol.graph.stereo_inchi, rct_gras))
-        prd_ichs = list(map(automol.graph.stereo_inchi, prd_gras))
-        print(rct_ichs)
-        print(prd_ichs)
-        print()
+    _print_stereo_inchis(srxns)
 
 
-def test__prod__hydrogen_migration():
-    """ test hydrogen migration product enumeration
+def test__stereo__parallel():
+    """ test that parallel stereo expansion matches the serial one
     """
-    rct_smis = ['C=CCC[CH2]']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
+    rct_gras = [automol.geom.connectivity_graph(_geometry(smi))
+                for smi in ['CC=CC', '[OH]']]
+    prd_gras = [automol.geom.connectivity_graph(_geometry('CC(O)[CH]C'))]
     rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
+    prd_gras, _ = automol.graph.standard_keys_for_sequence(prd_gras)
+    rxn = automol.reac.find(rct_gras, prd_gras, limit=1)[0]
 
-    # Enumerate all possible reactions, but select the hydrogen migrations
-    rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'hydrogen migration']
-    print('number of migrations:', len(rxns))
-    assert rxns
-
-    # Verify the enumerated reactions with the classifier
-    for rxn in rxns:
-        rct_gras_ = automol.reac.reactant_graphs(rxn)
-        prd_gras_ = automol.reac.product_graphs(rxn)
-        assert rct_gras_ == rct_gras
-        rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'hydrogen migration' for r in rxns_)
-
-
-def test__prod__beta_scission():
-    """ test beta scission product enumeration
-    """
-    rct_smis = ['C=C[CH]CC']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
-    rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
-
-    # Enumerate all possible reactions, but select the beta scissions
-    rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'beta scission']
-    print('number of beta scissions:', len(rxns))
-    assert rxns
-
-    # Verify the enumerated reactions with the classifier
-    for rxn in rxns:
-        rct_gras_ = automol.reac.reactant_graphs(rxn)
-        prd_gras_ = automol.reac.product_graphs(rxn)
-        assert rct_gras_ == rct_gras
-        rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'beta scission' for r in rxns_)
-
-
-def test__prod__elimination():
-    """ test elimination product enumeration
-    """
-    rct_smis = ['CCCO[O]']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
-    rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
-
-    # Enumerate all possible reactions, but select the eliminations
-    rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'elimination']
-    print('number of eliminations:', len(rxns))
-    assert rxns
-
-    # Verify the enumerated reactions with the classifier
-    for rxn in rxns:
-        rct_gras_ = automol.reac.reactant_graphs(rxn)
-        prd_gras_ = automol.reac.product_graphs(rxn)
-        assert rct_gras_ == rct_gras
-        rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'elimination' for r in rxns_)
-
-
-def test__prod__hydrogen_abstraction():
-    """ test hydrogen abstraction product enumeration
-    """
-    rct_smis = ['CC(=O)C', '[CH3]']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
-    rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
-
-    # Enumerate all possible reactions, but select the hydrogen abstractions
-    rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'hydrogen abstraction']
-    print('number of hydrogen abstractions:', len(rxns))
-    assert rxns
-
-    # Verify the enumerated reactions with the classifier
-    for rxn in rxns:
-        rct_gras_ = automol.reac.reactant_graphs(rxn)
-        prd_gras_ = automol.reac.product_graphs(rxn)
-        assert rct_gras_ == rct_gras
-        rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'hydrogen abstraction' for r in rxns_)
-
-
-def test__prod__addition():
-    """ test addition product enumeration
-    """
-    rct_smis = ['C=CC=C', '[CH3]']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
-    rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
-
-    # Enumerate all possible reactions, but select the additions
-    rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'addition']
-    print('number of additions:', len(rxns))
-    assert rxns
-
-    # Verify the enumerated reactions with the classifier
-    for rxn in rxns:
-        rct_gras_ = automol.reac.reactant_graphs(rxn)
-        prd_gras_ = automol.reac.product_graphs(rxn)
-        assert rct_gras_ == rct_gras
-        rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'addition' for r in rxns_)
-
-
-def test__prod__insertion():
-    """ test insertion product enumeration
+    srxns = automol.reac.expand_stereo(rxn)
+    assert len(srxns) == 4
+    assert automol.reac.expand_stereo(rxn, nprocs=2) == srxns
+
+
+@pytest.mark.parametrize('rxn_class,rct_smis', [
+    ('hydrogen migration', ['C=CCC[CH2]']),
+    ('beta scission', ['C=C[CH]CC']),
+    ('elimination', ['CCCO[O]']),
+    ('hydrogen abstraction', ['CC(=O)C', '[CH3]']),
+    ('addition', ['C=CC=C', '[CH3]']),
+    ('insertion', ['CC=C', 'O[O]']),
+])
+def test__prod(rxn_class, rct_smis):
+    """ test product enumeration for each reaction class
     """
-    rct_smis = ['CC=C', 'O[O]']
-    rct_ichs = list(map(automol.smiles.inchi, rct_smis))
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    rct_gras = tuple(map(automol.geom.connectivity_graph, rct_geos))
+    rct_gras = [automol.geom.connectivity_graph(_geometry(smi))
+                for smi in rct_smis]
     rct_gras, _ = automol.graph.standard_keys_for_sequence(rct_gras)
 
-    # Enumerate all possible reactions, but select the insertions
+    # Enumerate all possible reactions, but select the ones of this class
     rxns = [r for r in automol.reac.enumerate_reactions(rct_gras)
-            if r.class_ == 'insertion']
-    print('number of insertions:', len(rxns))
+            if r.class_ == rxn_class]
+    print('number of {} reactions:'.format(rxn_class), len(rxns))
     assert rxns
 
     # Verify the enumerated reactions with the classifier
@@ -1436,7 +1353,7 @@ def test__prod__insertion():
         prd_gras_ = automol.reac.product_graphs(rxn)
         assert rct_gras_ == rct_gras
         rxns_ = automol.reac.find(rct_gras_, prd_gras_)
-        assert any(r.class_ == 'insertion' for r in rxns_)
+        assert any(r.class_ == rxn_class for r in rxns_)
 
 
 if __name__ == '__main__':
@@ -1444,9 +1361,3 @@ if __name__ == '__main__':
     test__reac__addition()
     # test__reac__elimination()
     # test__reac__insertion()
-    # test__prod__hydrogen_migration()
-    # test__prod__beta_scission()
-    # test__prod__elimination()
-    # test__prod__hydrogen_abstraction()
-    # test__prod__addition()
-    # test__prod__insertion()
@@ -7,6 +7,7 @@ from automol.util._util import equivalence_partition
 from automol.util._util import value_similar_to
 from automol.util._util import scale_iterable
 from automol.util._util import formula_from_symbols
+from automol.util._util import yaml_loader
 # submodules
 from automol.util import vec
 from automol.util import mat
@@ -21,6 +22,7 @@ __all__ = [
     'value_similar_to',
     'scale_iterable',
     'formula_from_symbols',
+    'yaml_loader',
     # submodules
     'vec',
     'mat',
@@ -1,5 +1,6 @@
 """ miscellaneous utilities
 """
+import yaml
 from phydat import ptab
 
 
@@ -110,3 +111,14 @@ def _unique_item_counts(iterable):
     items = tuple(iterable)
 
     return {item: items.count(item) for item in sorted(set(items))}
+
+
+def yaml_loader():
+    """ Get the YAML loader for reading automol data strings.
+
+    These strings hold plain data only, so the safe loader is used, preferring
+    the libyaml-backed one when it is available.
+
+    :rtype: yaml loader class
+    """
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
@@ -8,7 +8,6 @@ except ImportError:
     from collections import Mapping as _Mapping
 import numpy
 from automol.util.dict_._dict_ import values_by_key as _values_by_key
-from automol.util.dict_._dict_ import transform_values as _transform_values
 
 
 def is_multidict(mdct):
@@ -35,20 +34,16 @@ def by_key_by_position(mdct, keys, pos):
 
 def set_by_key_by_position(mdct, dct, pos):
     """ set values by position and key
+
+    (only the values being set are rebuilt; the rest are shared with the
+    original dictionary, since they are immutable tuples)
     """
     assert is_multidict(mdct)
     assert set(dct.keys()) <= set(mdct.keys())
     if dct:
-        mdct = _unfreeze(mdct)
+        mdct = dict(mdct)
         for key, val in dct.items():
-            mdct[key][pos] = val
-        mdct = _freeze(mdct)
+            vals = list(mdct[key])
+            vals[pos] = val
+            mdct[key] = tuple(vals)
     return mdct
-
-
-def _unfreeze(mdct):
-    return dict(zip(mdct.keys(), map(list, mdct.values())))
-
-
-def _freeze(mdct):
-    return _transform_values(mdct, func=tuple)
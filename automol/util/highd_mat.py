@@ -21,12 +21,6 @@ def string(arr, include_zeros=False, include_perms=False,
             idx1 idx2 .. idxn  valn
     """
 
-    def _chk_zero(val, include_zeros):
-        """ decide to write value
-        """
-        iszero = np.isclose(val, 0.0)
-        return bool(not iszero or (iszero and include_zeros))
-
     def _chk_idxs(arr):
         """ decide if idxs
             check if any permutation of idxs is already written
@@ -41,16 +35,17 @@ def string(arr, include_zeros=False, include_perms=False,
 
         return fin_idxs
 
-    arr_str = ''
-    for idxs, val in _chk_idxs(arr):
-        if _chk_zero(val, include_zeros):
-            val_str = ''.join(('{0:<6d}'.format(idx+1) for idx in idxs))
-            val_str += val_format.format(val)
-            val_str += '\n'
+    fin_idxs = _chk_idxs(arr)
 
-            arr_str += val_str
+    # decide which values to write in one pass over all of them, then build
+    # the lines and join them at once
+    vals = np.array([val for _, val in fin_idxs], dtype=float)
+    writes = np.logical_or(~np.isclose(vals, 0.0), include_zeros)
 
-    arr_str.rstrip()
+    arr_str = ''.join(
+        ''.join('{0:<6d}'.format(idx+1) for idx in idxs) +
+        val_format.format(val) + '\n'
+        for (idxs, val), write in zip(fin_idxs, writes) if write)
 
     return arr_str
 
@@ -4,6 +4,12 @@ import numbers
 import numpy
 import transformations as tf
 
+# tolerances for the unit length check in unit_norm; these mirror the
+# numpy.allclose defaults (with a reference value of 1, the relative
+# tolerance adds directly), checked on a scalar without the allclose overhead
+UNIT_NORM_RTOL = 1e-5
+UNIT_NORM_ATOL = 1e-8
+
 
 def unit_norm(xyz):
     """ Normalize a vector (xyz) to 1.0.
@@ -14,7 +20,8 @@ def unit_norm(xyz):
     """
     norm = numpy.linalg.norm(xyz)
     uxyz = numpy.divide(xyz, norm)
-    assert numpy.allclose(numpy.linalg.norm(uxyz), 1.0)
+    assert (abs(numpy.linalg.norm(uxyz) - 1.0)
+            <= UNIT_NORM_ATOL + UNIT_NORM_RTOL)
     return uxyz
 
 